@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from homeassistant.core import HomeAssistant
 
 from .client import SOLARWATTClient
@@ -15,7 +17,7 @@ from .registry_migrations import migrate_device_registry_identifiers
 from .services import async_register_services
 from .stats_total import StatsTotalStore
 
-PLATFORMS: list[str] = ["sensor", "button", "select", "switch"]
+PLATFORMS: tuple[str, ...] = ("sensor", "button", "select", "switch")
 
 
 async def async_migrate_entry(
@@ -34,17 +36,27 @@ async def async_migrate_entry(
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: SOLARWATTConfigEntry) -> bool:
-    host = str(entry.data.get("host") or "").strip().lower()
-    username = str(entry.data.get("username") or "")
-    password = str(entry.data.get("password") or "")
+    data = entry.data
+    host = str(data.get("host") or "").strip().lower()
+    username = str(data.get("username") or "")
+    password = str(data.get("password") or "")
     client = SOLARWATTClient(hass, host=host, username=username, password=password)
     coordinator = SOLARWATTCoordinator(hass, entry, client)
     coordinator.stats_total_store = StatsTotalStore(hass, entry.entry_id)
     runtime_data_set = False
 
     try:
-        await coordinator.stats_total_store.async_load()
-        await coordinator.async_config_entry_first_refresh()
+        # The stats store load is local disk I/O and independent of the first
+        # network poll, so both run concurrently. async_refresh_things maps
+        # item names from the first snapshot and must stay sequential.
+        results = await asyncio.gather(
+            coordinator.stats_total_store.async_load(),
+            coordinator.async_config_entry_first_refresh(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         await coordinator.async_refresh_things(prefer_hems_cache=True)
         migrate_device_registry_identifiers(hass, entry, coordinator.things)
 
@@ -81,6 +93,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: SOLARWATTConfigEntry) ->
 
 
 async def _async_entry_updated(hass: HomeAssistant, entry: SOLARWATTConfigEntry) -> None:
+    coordinator = entry.runtime_data
+    if coordinator is not None and coordinator.apply_entry_update():
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
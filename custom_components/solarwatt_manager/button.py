@@ -12,7 +12,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     SOLARWATTConfigEntry,
     build_thing_device_info,
-    get_device_registry_anchor,
     get_selected_thing_uids,
 )
 from .entity_helpers import (
@@ -69,14 +68,15 @@ class SOLARWATTDiagnosticsRefreshButton(CoordinatorEntity, ButtonEntity):
         self._attr_unique_id = build_thing_diagnostics_refresh_unique_id(entry_id, thing_uid)
         self._attr_device_info = build_thing_device_info(
             self.coordinator.hass,
-            get_device_registry_anchor(self.coordinator.entry),
+            self.coordinator.device_anchor,
             thing,
             self.coordinator.things,
             selected_thing_uids,
-            str(self.coordinator.client.host or ""),
+            self.coordinator.configuration_host,
         )
 
     async def async_press(self) -> None:
         self.coordinator.invalidate_hems_cache()
+        # async_refresh_discovery_data already performs a full item refresh,
+        # so a trailing debounced refresh would only queue a second poll.
         await self.coordinator.async_refresh_discovery_data()
-        await self.coordinator.async_request_refresh()
@@ -7,9 +7,16 @@ from collections.abc import Awaitable, Callable
 from datetime import datetime
 from typing import Any
 
-from aiohttp import ClientError, ClientResponseError, ClientSession, CookieJar
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout, CookieJar
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
+try:
+    # Home Assistant ships orjson; fall back to aiohttp's stdlib parser
+    # when it is unavailable (e.g. in the standalone test environment).
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from .hems_client import (
     KiwiGridHEMSAuthError,
     KiwiGridHEMSClient,
@@ -54,6 +61,7 @@ class SolarwattProtocolError(SolarwattError):
 
 HEMSEndpointGetter = Callable[[], Awaitable[Any]]
 HEMS_STATS_HISTORY_REQUEST_TIMEOUT = 300
+_DEFAULT_TIMEOUT = ClientTimeout(total=5)
 LOCAL_ITEMS_SOURCE_ENERGY_OVERVIEW = "energy_overview"
 LOCAL_ITEMS_SOURCE_REST = "rest_items"
 LOCAL_THINGS_SOURCE_HEMS_CONFIGURATOR = "hems_configurator"
@@ -84,6 +92,10 @@ class SOLARWATTClient:
         )
         self.base = self._candidate_bases[0] if self._candidate_bases else ""
 
+        # A dedicated session is required here: Home Assistant's shared
+        # clientsession uses a safe cookie jar that silently drops the login
+        # cookie when the Manager is addressed by IP, and the session-scoped
+        # auth cookies must not leak into other integrations' requests.
         self._session = ClientSession(cookie_jar=CookieJar(unsafe=True))
         self.session_ttl = 900
         self._last_login = 0.0
@@ -199,7 +211,7 @@ class SOLARWATTClient:
             self._set_base(base)
             for username in usernames:
                 resp_status: int | None = None
-                resp_headers: dict[str, str] = {}
+                resp_location: str | None = None
                 resp_ct: str = ""
 
                 payload = {
@@ -214,12 +226,14 @@ class SOLARWATTClient:
                         "POST",
                         f"{self.base}/auth/login",
                         data=payload,
-                        timeout=5,
+                        timeout=_DEFAULT_TIMEOUT,
                         allow_redirects=False,
                         headers={"Content-Type": "application/x-www-form-urlencoded"},
                     ) as resp:
                         resp_status = resp.status
-                        resp_headers = dict(resp.headers)
+                        # CIMultiDict lookups are case-insensitive, so one
+                        # targeted read replaces copying all headers.
+                        resp_location = resp.headers.get("Location")
                         resp_ct = (resp.headers.get("Content-Type") or "").lower()
 
                         redirected_base = self._base_from_url(resp.url)
@@ -243,13 +257,13 @@ class SOLARWATTClient:
 
                     redirect_snippet = ""
                     if resp_status is not None and 300 <= resp_status < 400:
-                        loc = resp_headers.get("Location") or resp_headers.get("location")
+                        loc = resp_location
                         if loc:
                             follow_url = loc if loc.startswith("http") else f"{self.base}{loc}"
                             async with self._request(
                                 "GET",
                                 follow_url,
-                                timeout=5,
+                                timeout=_DEFAULT_TIMEOUT,
                             ) as redirect_resp:
                                 redirected_base = self._base_from_url(redirect_resp.url)
                                 if redirected_base:
@@ -309,7 +323,7 @@ class SOLARWATTClient:
                     async with self._request(
                         "GET",
                         url,
-                        timeout=5,
+                        timeout=_DEFAULT_TIMEOUT,
                         allow_redirects=True,
                     ) as resp:
                         redirected_base = self._base_from_url(resp.url)
@@ -342,15 +356,16 @@ class SOLARWATTClient:
             raise last_connection_error
         raise SolarwattNotManagerError("No SOLARWATT Manager login page detected")
 
-    async def _ensure_json(self, resp, where: str) -> Any:
-        """Parse JSON with better diagnostics."""
-        ct = (resp.headers.get("Content-Type") or "").lower()
+    async def _ensure_json(self, resp, ct: str, where: str) -> Any:
+        """Parse JSON with better diagnostics, reusing the caller's Content-Type."""
         if "json" not in ct:
             snippet = await self._read_snippet(resp)
             raise SolarwattProtocolError(
                 f"Antwort ist kein JSON bei {where}. Status={resp.status}, Content-Type={ct or '<none>'}, "
                 f"Cookies={self._cookie_debug()}, Snippet={snippet}"
             )
+        if orjson is not None:
+            return orjson.loads(await resp.read())
         return await resp.json()
 
     async def _ensure_session(self) -> None:
@@ -366,7 +381,7 @@ class SOLARWATTClient:
             async with self._request(
                 "GET",
                 url,
-                timeout=5,
+                timeout=_DEFAULT_TIMEOUT,
             ) as resp:
                 redirected_base = self._base_from_url(resp.url)
                 if redirected_base:
@@ -388,7 +403,7 @@ class SOLARWATTClient:
                         raise SolarwattAuthError(f"Session expired while requesting {where}")
 
                 resp.raise_for_status()
-                return await self._ensure_json(resp, where)
+                return await self._ensure_json(resp, ct, where)
 
     async def async_validate_connection(self) -> None:
         """Test connection to SOLARWATT Manager."""
@@ -846,13 +861,13 @@ class SOLARWATTClient:
                 items = await self.async_get_energy_overview_items()
                 self._local_items_source = LOCAL_ITEMS_SOURCE_ENERGY_OVERVIEW
                 return items
-            self._log.error(f"HTTP error {e.status} fetching items from {self.host}")
+            self._log.error("HTTP error %s fetching items from %s", e.status, self.host)
             raise SolarwattConnectionError(f"HTTP error {e.status}") from e
         except (ClientError, asyncio.TimeoutError) as e:
-            self._log.exception(f"Connection error fetching items from {self.host}: {e}")
+            self._log.exception("Connection error fetching items from %s: %s", self.host, e)
             raise SolarwattConnectionError(str(e)) from e
         except Exception as e:
-            self._log.exception(f"Unexpected error fetching items from {self.host}: {e}")
+            self._log.exception("Unexpected error fetching items from %s: %s", self.host, e)
             raise SolarwattConnectionError(str(e)) from e
 
     async def async_get_things(self) -> list[dict[str, Any]]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Awaitable, Callable, Mapping
 import ipaddress
 import logging
@@ -113,32 +114,43 @@ async def _async_validate_connection_settings(
     if errors:
         return errors
 
+    checks = []
     host = entry_data.get(CONF_HOST)
     if host is not None:
-        _, errors = await _async_with_client(
-            hass,
-            host=host,
-            username=str(entry_data[CONF_USERNAME]),
-            password=str(entry_data[CONF_PASSWORD]),
-            action=SOLARWATTClient.async_validate_connection,
-            action_label="testing SOLARWATT connection",
+        checks.append(
+            _async_with_client(
+                hass,
+                host=host,
+                username=str(entry_data[CONF_USERNAME]),
+                password=str(entry_data[CONF_PASSWORD]),
+                action=SOLARWATTClient.async_validate_connection,
+                action_label="testing SOLARWATT connection",
+            )
         )
-        if errors:
-            return errors
-
     if options.get(CONF_KIWIGRID_HEMS_ENABLED):
-        _, errors = await _async_with_client(
-            hass,
-            host="",
-            username="",
-            password="",
-            action=lambda client: client.async_get_hems_things(
-                username=str(options[CONF_KIWIGRID_HEMS_USERNAME]),
-                password=str(options[CONF_KIWIGRID_HEMS_PASSWORD]),
-            ),
-            action_label="testing KiwiGrid HEMS connection",
-            auth_error_code="invalid_hems_auth",
+        checks.append(
+            _async_with_client(
+                hass,
+                host="",
+                username="",
+                password="",
+                action=lambda client: client.async_get_hems_things(
+                    username=str(options[CONF_KIWIGRID_HEMS_USERNAME]),
+                    password=str(options[CONF_KIWIGRID_HEMS_PASSWORD]),
+                ),
+                action_label="testing KiwiGrid HEMS connection",
+                auth_error_code="invalid_hems_auth",
+            )
         )
+    if not checks:
+        return errors
+
+    # The local and cloud checks are independent, so running them
+    # concurrently makes the submit wait for the slower of the two round
+    # trips instead of their sum. Local errors keep precedence.
+    for _, check_errors in await asyncio.gather(*checks):
+        if check_errors:
+            return check_errors
     return errors
 
 
@@ -322,6 +334,24 @@ def _build_option_schema_fields(values: Mapping[str, Any]) -> dict[Any, Any]:
     }
 
 
+def _build_user_schema_fields(values: Mapping[str, Any]) -> dict[Any, Any]:
+    """Build voluptuous schema fields for the user step."""
+    return {
+        vol.Optional(CONF_HOST, default=values.get(CONF_HOST, "")): str,
+        vol.Optional(
+            CONF_USERNAME,
+            default=values.get(CONF_USERNAME, "installer"),
+        ): str,
+        vol.Optional(CONF_PASSWORD, default=values.get(CONF_PASSWORD, "")): str,
+        **_build_option_schema_fields(values),
+    }
+
+
+# The first render of the user step always uses static defaults, so its
+# schema is built once at import instead of on every form render.
+_DEFAULT_USER_SCHEMA = vol.Schema(_build_user_schema_fields({}))
+
+
 def _normalize_options_input(
     user_input: Mapping[str, Any],
     current_options: Mapping[str, Any] | None = None,
@@ -399,17 +429,21 @@ def _validate_user_data(
     entry_data: Mapping[str, Any],
     options: Mapping[str, Any],
 ) -> dict[str, str]:
-    """Validate normalized user-step data."""
+    """Validate normalized user-step data.
+
+    Callers always pass values that went through the _normalize_* helpers,
+    so the fields are already stripped strings and can be used directly.
+    """
     errors = _validate_options_data(options)
 
     local_host = entry_data.get(CONF_HOST)
-    local_username = str(entry_data.get(CONF_USERNAME) or "").strip()
-    local_password = str(entry_data.get(CONF_PASSWORD) or "").strip()
+    local_username = str(entry_data.get(CONF_USERNAME) or "")
+    local_password = str(entry_data.get(CONF_PASSWORD) or "")
     hems_enabled = bool(options.get(CONF_KIWIGRID_HEMS_ENABLED))
-    hems_username = str(options.get(CONF_KIWIGRID_HEMS_USERNAME) or "").strip()
-    hems_password = str(options.get(CONF_KIWIGRID_HEMS_PASSWORD) or "").strip()
+    hems_username = str(options.get(CONF_KIWIGRID_HEMS_USERNAME) or "")
+    hems_password = str(options.get(CONF_KIWIGRID_HEMS_PASSWORD) or "")
 
-    if local_host is None and str(entry_data.get(_RAW_HOST_KEY) or "").strip():
+    if local_host is None and str(entry_data.get(_RAW_HOST_KEY) or ""):
         errors[CONF_HOST] = "invalid_host"
     if local_host and not local_username:
         errors[CONF_USERNAME] = "invalid_username"
@@ -546,19 +580,10 @@ class SOLARWATTItemsConfigFlow(  # type: ignore[call-arg]
     def _build_user_schema(
         self, user_input: Mapping[str, Any] | None = None
     ) -> vol.Schema:
-        """Build the user-step schema."""
-        values = dict(user_input or {})
-        return vol.Schema(
-            {
-                vol.Optional(CONF_HOST, default=values.get(CONF_HOST, "")): str,
-                vol.Optional(
-                    CONF_USERNAME,
-                    default=values.get(CONF_USERNAME, "installer"),
-                ): str,
-                vol.Optional(CONF_PASSWORD, default=values.get(CONF_PASSWORD, "")): str,
-                **_build_option_schema_fields(values),
-            }
-        )
+        """Build the user-step schema, rebuilding only for dynamic defaults."""
+        if not user_input:
+            return _DEFAULT_USER_SCHEMA
+        return vol.Schema(_build_user_schema_fields(dict(user_input)))
 
     def _build_connection_schema(
         self,
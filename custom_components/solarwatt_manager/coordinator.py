@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterable, Mapping
 from datetime import timedelta
 import logging
+import sys
 import time
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -21,6 +22,7 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
+    get_device_registry_anchor,
 )
 from .entity_helpers import detach_entityless_thing_devices, ensure_parent_devices_registered
 from .hems_api import item_names_to_thing_uids
@@ -32,6 +34,7 @@ from .thing_matching import (
 )
 
 if TYPE_CHECKING:
+    from .state_parser import ParsedState
     from .stats_total import StatsTotalStore
 
 
@@ -39,12 +42,19 @@ class SOLARWATTCoordinator(DataUpdateCoordinator[dict[str, SOLARWATTItem]]):
     def __init__(self, hass: HomeAssistant, entry, client: SOLARWATTClient):
         self.entry = entry
         self.client = client
+        self.configuration_host = str(client.host or "")
+        self._device_anchor: str | None = None
+        self._applied_entry_state: tuple[dict[str, Any], dict[str, Any]] = (
+            dict(entry.data),
+            dict(entry.options),
+        )
         self.stats_total_store: StatsTotalStore | None = None
         self.things: dict[str, dict[str, Any]] = {}
         self.item_to_thing_uid: dict[str, str] = {}
         self.item_to_channel_metadata: dict[str, dict[str, str]] = {}
         self.duplicate_item_targets: dict[str, str] = {}
         self._discovery_callbacks: set[Callable[[Mapping[str, Any] | None], None]] = set()
+        self._parse_cache: dict[str, tuple[tuple[Any, ...], ParsedState]] = {}
         self._local_items_cache: list[dict[str, Any]] = []
         self.local_last_error: str | None = None
         self._hems_items_cache: list[dict[str, Any]] = []
@@ -72,6 +82,52 @@ class SOLARWATTCoordinator(DataUpdateCoordinator[dict[str, SOLARWATTItem]]):
             update_interval=timedelta(seconds=int(scan)),
         )
 
+    @property
+    def device_anchor(self) -> str:
+        """Return the device-registry anchor, computed once per entry setup.
+
+        The anchor is resolved lazily because the installation-ID migration
+        during setup may still update the entry data after the coordinator
+        was constructed; entities only read it after that migration ran.
+        """
+        if self._device_anchor is None:
+            self._device_anchor = get_device_registry_anchor(self.entry)
+        return self._device_anchor
+
+    def apply_entry_update(self) -> bool:
+        """Apply a compatible entry update in place; False requires a reload.
+
+        No-op saves from the options flow and pure scan-interval changes do
+        not need the full teardown/reconnect cycle of a config-entry reload.
+        """
+        data = dict(self.entry.data)
+        options = dict(self.entry.options)
+        applied_data, applied_options = self._applied_entry_state
+        if data == applied_data and options == applied_options:
+            return True
+        if data != applied_data:
+            return False
+
+        changed_options = {
+            key
+            for key in options.keys() | applied_options.keys()
+            if options.get(key) != applied_options.get(key)
+        }
+        if not changed_options <= {CONF_SCAN_INTERVAL, CONF_KIWIGRID_HEMS_SCAN_INTERVAL}:
+            return False
+
+        scan = _validated_scan_interval(
+            options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            default=DEFAULT_SCAN_INTERVAL,
+        )
+        self.update_interval = timedelta(seconds=int(scan))
+        self._hems_scan_interval = _validated_scan_interval(
+            options.get(CONF_KIWIGRID_HEMS_SCAN_INTERVAL, DEFAULT_KIWIGRID_HEMS_SCAN_INTERVAL),
+            default=DEFAULT_KIWIGRID_HEMS_SCAN_INTERVAL,
+        )
+        self._applied_entry_state = (data, options)
+        return True
+
     def register_discovery_callback(
         self,
         callback: Callable[[Mapping[str, Any] | None], None],
@@ -129,13 +185,27 @@ class SOLARWATTCoordinator(DataUpdateCoordinator[dict[str, SOLARWATTItem]]):
 
         self._handle_source_errors(items, source_successes, source_errors)
 
+        # Most item states are unchanged between polls; reuse the previous
+        # parse result instead of re-running parse_state per item. Only the
+        # parsed value is cached — raw stays fresh for diagnostics.
+        previous_parse_cache = self._parse_cache
+        parse_cache: dict[str, tuple[tuple[Any, ...], ParsedState]] = {}
+
         def _to_item(name: str, it: dict[str, Any]) -> SOLARWATTItem:
             pattern = (it.get("stateDescription") or {}).get("pattern")
+            oh_type = it.get("type")
+            signature = (it.get("state"), pattern, oh_type)
+            cached = previous_parse_cache.get(name)
+            if cached is not None and cached[0] == signature:
+                parsed = cached[1]
+            else:
+                parsed = parse_state(signature[0], pattern, oh_type)
+            parse_cache[name] = (signature, parsed)
             return SOLARWATTItem(
                 name=name,
                 raw=it,
-                parsed=parse_state(it.get("state"), pattern, it.get("type")),
-                oh_type=it.get("type"),
+                parsed=parsed,
+                oh_type=oh_type,
                 editable=bool(it.get("editable")),
                 label=it.get("label"),
                 category=it.get("category"),
@@ -143,8 +213,11 @@ class SOLARWATTCoordinator(DataUpdateCoordinator[dict[str, SOLARWATTItem]]):
 
         out_all: dict[str, SOLARWATTItem] = {}
         for idx, it in enumerate(items):
-            n = it.get("name", f"unknown_{idx}")
+            # Item names recur on every poll and as entity lookup keys;
+            # interning dedupes them and makes those dict probes identity hits.
+            n = sys.intern(it.get("name", f"unknown_{idx}"))
             out_all[n] = _to_item(n, it)
+        self._parse_cache = parse_cache
         return out_all
 
     async def _async_update_local_items(
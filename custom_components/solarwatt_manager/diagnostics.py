@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from collections import Counter
 from datetime import datetime, timezone
+import re
 from typing import Any
 
 from homeassistant.core import HomeAssistant
@@ -17,6 +17,14 @@ from .const import (
 )
 
 
+_DROPPED_KEYS = frozenset({"serial", "serialnumber"})
+_EMPTY_STATUS_INFO: dict[str, Any] = {}
+_MISSING_UNIT_VALUES = frozenset({None, "", "N"})
+_UNIT_KEYWORD_RE = re.compile(r"power|work|energy")
+_REDACTED_KEYS = frozenset({"host", "installationid", "username"})
+_REDACT_KEYWORD_RE = re.compile(r"password|token|cookie|authorization|session")
+
+
 def _redact(obj: Any) -> Any:
     """Redact secrets from diagnostics output."""
     if isinstance(obj, dict):
@@ -24,12 +32,9 @@ def _redact(obj: Any) -> Any:
         for k, v in obj.items():
             lk = str(k).lower()
             normalized_key = lk.replace("_", "").replace("-", "")
-            if normalized_key in {"serial", "serialnumber"}:
+            if normalized_key in _DROPPED_KEYS:
                 continue
-            if normalized_key in {"host", "installationid", "username"} or any(
-                s in lk
-                for s in ("password", "token", "cookie", "authorization", "session")
-            ):
+            if normalized_key in _REDACTED_KEYS or _REDACT_KEYWORD_RE.search(lk):
                 out[k] = "REDACTED"
             else:
                 out[k] = _redact(v)
@@ -41,21 +46,23 @@ def _redact(obj: Any) -> Any:
 
 def _item_payload(item: Any) -> dict[str, Any]:
     """Build a compact diagnostics payload for a SOLARWATTItem."""
-    parsed = getattr(item, "parsed", None)
-    raw = getattr(item, "raw", None)
+    # Coordinator data always holds slotted SOLARWATTItem instances, so
+    # direct attribute access replaces the former getattr-with-default chains.
+    parsed = item.parsed
+    raw = item.raw
     pattern = None
     if isinstance(raw, dict):
         pattern = (raw.get("stateDescription") or {}).get("pattern")
     return {
-        "type": getattr(item, "oh_type", None),
-        "label": getattr(item, "label", None),
-        "category": getattr(item, "category", None),
-        "editable": getattr(item, "editable", None),
+        "type": item.oh_type,
+        "label": item.label,
+        "category": item.category,
+        "editable": item.editable,
         "raw_state": raw.get("state") if isinstance(raw, dict) else None,
         "state_pattern": pattern,
-        "parsed_value": getattr(parsed, "value", None),
-        "unit": getattr(parsed, "unit", None),
-        "timestamp_ms": getattr(parsed, "timestamp_ms", None),
+        "parsed_value": parsed.value if parsed else None,
+        "unit": parsed.unit if parsed else None,
+        "timestamp_ms": parsed.timestamp_ms if parsed else None,
     }
 
 
@@ -68,15 +75,13 @@ def _editable_count_key(editable: Any) -> str:
     return "unknown"
 
 
-def _problem_item_issue(item_name: str, payload: dict[str, Any]) -> str | None:
-    """Return the most relevant diagnostics issue for one item payload."""
-    value = payload.get("parsed_value")
+def _problem_item_issue(item_name: str, value: Any, unit: Any) -> str | None:
+    """Return the most relevant diagnostics issue for one item's parsed fields."""
     if value is None:
         return "value is NULL"
     if not isinstance(value, (int, float)):
         return f"non-numeric value: {value!r}"
-    unit = payload.get("unit")
-    if unit in (None, "", "N") and any(token in item_name for token in ("power", "work", "energy")):
+    if unit in _MISSING_UNIT_VALUES and _UNIT_KEYWORD_RE.search(item_name):
         return "missing unit"
     return None
 
@@ -101,10 +106,10 @@ def _energy_sensor_write(state) -> dict[str, Any] | None:
 def _collect_item_diagnostics(items: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any], list[dict[str, Any]]]:
     """Collect compact item payloads, aggregate stats, and problem candidates."""
     item_payloads: dict[str, Any] = {}
-    type_counts: Counter[str] = Counter()
-    category_counts: Counter[str] = Counter()
-    unit_counts: Counter[str] = Counter()
-    editable_counts: Counter[str] = Counter()
+    type_counts: dict[str, int] = {}
+    category_counts: dict[str, int] = {}
+    unit_counts: dict[str, int] = {}
+    editable_counts: dict[str, int] = {}
     problem_items: list[dict[str, Any]] = []
     numeric_count = 0
     missing_label_count = 0
@@ -112,10 +117,13 @@ def _collect_item_diagnostics(items: dict[str, Any]) -> tuple[dict[str, Any], di
     non_numeric_count = 0
 
     for item_name, item in items.items():
-        clean_name = (item_name or "").lstrip("#")
+        clean_name = (item_name or "").removeprefix("#")
         payload = _item_payload(item)
-        value = payload.get("parsed_value")
         item_payloads[clean_name] = payload
+        # _item_payload always populates these keys, so index access into
+        # locals beats repeated .get() lookups in this per-item loop.
+        value = payload["parsed_value"]
+        unit = payload["unit"]
 
         if isinstance(value, (int, float)):
             numeric_count += 1
@@ -124,24 +132,28 @@ def _collect_item_diagnostics(items: dict[str, Any]) -> tuple[dict[str, Any], di
         else:
             non_numeric_count += 1
 
-        type_counts[payload.get("type") or "unknown"] += 1
-        category_counts[payload.get("category") or "unknown"] += 1
-        unit_counts[payload.get("unit") or "none"] += 1
-        editable_counts[_editable_count_key(payload.get("editable"))] += 1
+        type_key = payload["type"] or "unknown"
+        type_counts[type_key] = type_counts.get(type_key, 0) + 1
+        category_key = payload["category"] or "unknown"
+        category_counts[category_key] = category_counts.get(category_key, 0) + 1
+        unit_key = unit or "none"
+        unit_counts[unit_key] = unit_counts.get(unit_key, 0) + 1
+        editable_key = _editable_count_key(payload["editable"])
+        editable_counts[editable_key] = editable_counts.get(editable_key, 0) + 1
 
-        if not payload.get("label"):
+        if not payload["label"]:
             missing_label_count += 1
-        if issue := _problem_item_issue(clean_name, payload):
+        if issue := _problem_item_issue(clean_name, value, unit):
             problem_items.append({"name": clean_name, "issue": issue})
 
     return (
         item_payloads,
         {
             "numeric_items": numeric_count,
-            "types": dict(type_counts),
-            "categories": dict(category_counts),
-            "units": dict(unit_counts),
-            "editable": dict(editable_counts),
+            "types": type_counts,
+            "categories": category_counts,
+            "units": unit_counts,
+            "editable": editable_counts,
             "missing_label": missing_label_count,
             "null_value": null_value_count,
             "non_numeric_value": non_numeric_count,
@@ -207,7 +219,8 @@ async def async_get_config_entry_diagnostics(
     for uid, thing in things.items():
         status_info = thing.get("statusInfo")
         if not isinstance(status_info, dict):
-            status_info = {}
+            # Shared read-only fallback; avoids one dict allocation per thing.
+            status_info = _EMPTY_STATUS_INFO
         things_compact[uid] = {
             "label": thing.get("label"),
             "thing_type_uid": thing.get("thingTypeUID") or thing.get("thingTypeUid"),
@@ -215,11 +228,11 @@ async def async_get_config_entry_diagnostics(
             "status": status_info.get("status"),
             "status_detail": status_info.get("statusDetail"),
             "properties": thing.get("properties"),
-            "channels_count": len(thing.get("channels") or []),
+            "channels_count": len(thing.get("channels") or ()),
         }
 
     data: dict[str, Any] = {
-        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "entry": {
             "entry_id": entry.entry_id,
             "title": entry.title,
@@ -235,19 +248,22 @@ async def async_get_config_entry_diagnostics(
             "numeric_items": item_stats["numeric_items"],
             "last_exception": repr(getattr(coordinator, "last_exception", None)) if getattr(coordinator, "last_exception", None) else None,
         },
-        "kiwigrid_hems": _redact(_hems_status_payload(coordinator)),
+        # data_stats, problem_items and the HEMS status payload carry fixed
+        # key sets (counters, name/issue records, last_success/last_error)
+        # that can never match the redaction rules, so they skip the walk.
+        # Entry data/options, thing properties (serial numbers) and the
+        # item/entity maps keep it.
+        "kiwigrid_hems": _hems_status_payload(coordinator),
         "energy_settings": {
             "energy_delta_kwh": energy_delta_kwh,
             "energy_sensors_last_write": _redact(energy_sensor_writes),
         },
-        "data_stats": _redact({key: value for key, value in item_stats.items() if key != "numeric_items"}),
+        "data_stats": {key: value for key, value in item_stats.items() if key != "numeric_items"},
         "data_items_compact": _redact(item_payloads),
-        "problem_items": _redact(
-            {
-                "problem_items_top_20": problem_items[:20],
-                "problem_items_total": len(problem_items),
-            }
-        ),
+        "problem_items": {
+            "problem_items_top_20": problem_items[:20],
+            "problem_items_total": len(problem_items),
+        },
         "things": _redact(
             {
                 "things_count": len(things_compact),
@@ -76,7 +76,11 @@ def is_hems_optimizable_thing(thing: Mapping[str, Any]) -> bool:
 
 def is_switch_item(item: Any) -> bool:
     """Return True for switch-like OpenHAB items that are not exposed as sensors."""
-    return (getattr(item, "oh_type", None) or "").startswith("Switch")
+    is_switch = getattr(item, "is_switch", None)
+    if is_switch is not None:
+        return is_switch
+    oh_type = getattr(item, "oh_type", None)
+    return oh_type is not None and oh_type.startswith("Switch")
 
 
 def iter_item_sensor_names(
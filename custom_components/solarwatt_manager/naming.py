@@ -55,13 +55,25 @@ _DISPLAY_ACRONYM_RE = re.compile(
 )
 
 
-@lru_cache(maxsize=1)
-def _compiled_conditional_id_rules() -> list[re.Pattern[str]]:
-    return [re.compile(pattern) for pattern in CONDITIONAL_ID_RULES]
-
-@lru_cache(maxsize=1)
-def _compiled_static_normalization_rules() -> list[tuple[re.Pattern[str], str]]:
-    return [(re.compile(pattern), repl) for pattern, repl in STATIC_NORMALIZATION_RULES]
+def _literal_prefix(pattern: str) -> str:
+    """Return the literal prefix of one ^-anchored rule pattern."""
+    anchored = pattern.removeprefix("^")
+    for index, char in enumerate(anchored):
+        if char in "([\\.?*+|{":
+            return anchored[:index]
+    return anchored
+
+
+# Compiled once at import; the rule lists are module constants, so the
+# former lru_cache(maxsize=1) indirection only added a call per lookup.
+# Each rule is paired with its literal prefix so a cheap startswith check
+# decides whether the regex engine needs to run at all.
+_CONDITIONAL_ID_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (_literal_prefix(pattern), re.compile(pattern)) for pattern in CONDITIONAL_ID_RULES
+)
+_STATIC_NORMALIZATION_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile(pattern), repl) for pattern, repl in STATIC_NORMALIZATION_RULES
+)
 
 
 
@@ -93,11 +105,11 @@ def is_hems_item_name(raw: str) -> bool:
 
 def clean_item_key(raw: str) -> str:
     """Strip OpenHAB leading '#' used for metadata items."""
-    return (raw or "").lstrip("#")
+    return (raw or "").removeprefix("#")
 
 
 def _normalize_static_item_name(name: str) -> str:
-    for pattern, repl in _compiled_static_normalization_rules():
+    for pattern, repl in _STATIC_NORMALIZATION_PATTERNS:
         name = pattern.sub(repl, name)
     return name
 
@@ -106,18 +118,32 @@ def normalize_item_name(
     raw: str,
 ) -> str:
     """Normalize item names using conditional and static normalization rules."""
-    name = clean_item_key(raw)
+    return _normalize_clean_item_name(clean_item_key(raw))
 
-    for pattern in _compiled_conditional_id_rules():
-        name = pattern.sub("", name)
+
+@lru_cache(maxsize=4096)
+def _normalize_clean_item_name(name: str) -> str:
+    """Run the rule cascade, memoized per cleaned name.
+
+    The set of item names is static between coordinator refreshes, and
+    caching behind clean_item_key lets '#foo' and 'foo' share one entry.
+    """
+    for prefix, pattern in _CONDITIONAL_ID_PATTERNS:
+        if name.startswith(prefix):
+            name = pattern.sub("", name)
 
     return _normalize_static_item_name(name)
 
 
+@lru_cache(maxsize=4096)
 def item_entity_name(
     raw: str,
 ) -> str:
-    """Return the user-facing entity name derived from one raw item key."""
+    """Return the user-facing entity name derived from one raw item key.
+
+    Entities re-derive their display name on every coordinator update, so
+    the whole normalize/split/format pipeline is memoized per raw key.
+    """
     if hems_suffix := hems_item_suffix(raw):
         base_name = hems_suffix
     else:
@@ -131,6 +157,7 @@ def item_entity_name(
     return format_display_name(base_name)
 
 
+@lru_cache(maxsize=4096)
 def normalize_display_acronyms(name: str) -> str:
     """Normalize known acronyms without changing other display-name casing."""
     return _DISPLAY_ACRONYM_RE.sub(
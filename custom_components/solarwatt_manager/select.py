@@ -12,7 +12,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     SOLARWATTConfigEntry,
     build_thing_device_info,
-    get_device_registry_anchor,
     get_selected_thing_uids,
 )
 from .entity_helpers import (
@@ -137,11 +136,11 @@ class SOLARWATTHEMSOptimizationSelect(CoordinatorEntity, SelectEntity):
         )
         self._attr_device_info = build_thing_device_info(
             self.coordinator.hass,
-            get_device_registry_anchor(self.coordinator.entry),
+            self.coordinator.device_anchor,
             thing,
             self.coordinator.things,
             selected_thing_uids,
-            str(self.coordinator.client.host or ""),
+            self.coordinator.configuration_host,
         )
 
     @property
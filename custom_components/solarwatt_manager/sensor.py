@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 import math
+import sys
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
@@ -21,7 +22,6 @@ from .const import (
     build_thing_device_identifier,
     build_thing_device_info,
     get_disable_duplicate_item_entities,
-    get_device_registry_anchor,
     get_registry_device_name,
     get_selected_thing_uids,
     get_thing_display_name,
@@ -174,7 +174,9 @@ class SOLARWATTItemSensor(CoordinatorEntity, SensorEntity):
         selected_thing_uids: set[str] | None = None,
     ):
         super().__init__(coordinator)
-        self._item_name = item_name
+        # Coordinator data keys are interned; matching here keeps the per-poll
+        # data.get(self._item_name) probe on the identity fast path.
+        self._item_name = sys.intern(item_name)
         self._default_device_name = device_name
         self._energy_delta_kwh = energy_delta_kwh
         self._power_unavailable_threshold = max(int(power_unavailable_threshold), 0)
@@ -191,8 +193,8 @@ class SOLARWATTItemSensor(CoordinatorEntity, SensorEntity):
 
         # Resolve the owning HA device once so naming and registry mapping stay aligned.
         things = self.coordinator.things
-        self._device_anchor = get_device_registry_anchor(self.coordinator.entry)
-        configuration_host = str(self.coordinator.client.host or "")
+        self._device_anchor = self.coordinator.device_anchor
+        configuration_host = self.coordinator.configuration_host
         self._thing_uid = self.coordinator.item_to_thing_uid.get(item_name)
         thing = things.get(self._thing_uid) if self._thing_uid else None
         self._attr_device_info = (
@@ -213,6 +215,8 @@ class SOLARWATTItemSensor(CoordinatorEntity, SensorEntity):
         )
         item = (self.coordinator.data or {}).get(item_name)
         channel_metadata = self.coordinator.item_to_channel_metadata.get(item_name)
+        # Seed the value cache so native_value is valid before the first update.
+        self._current_value = self._current_item_value()
 
         self._attr_name = self._item_display_name()
         if item and item.raw.get("entityCategory") == "diagnostic":
@@ -235,6 +239,11 @@ class SOLARWATTItemSensor(CoordinatorEntity, SensorEntity):
                 self._attr_state_class in (SensorStateClass.TOTAL, SensorStateClass.TOTAL_INCREASING)
             )
             self._is_power = self._attr_device_class == SensorDeviceClass.POWER
+        # Most sensors are neither power nor filtered energy; let them skip
+        # the numeric bookkeeping on the per-update hot path entirely.
+        self._tracks_numeric_state = self._is_total_increasing_energy or (
+            self._is_power and self._power_unavailable_threshold > 0
+        )
 
     # Entity/device naming helpers.
     def _thing(self) -> dict | None:
@@ -313,12 +322,13 @@ class SOLARWATTItemSensor(CoordinatorEntity, SensorEntity):
         return False
 
     def _current_item_value(self):
+        """Look up the latest parsed value; updates cache it in _current_value."""
         item = (self.coordinator.data or {}).get(self._item_name)
         if not item:
             return None
         val = item.parsed.value
         if isinstance(val, str):
-            return val.lstrip("#")
+            return val.removeprefix("#")
         return val
 
     # CoordinatorEntity hook: decide when state changes should reach Home Assistant.
@@ -327,7 +337,9 @@ class SOLARWATTItemSensor(CoordinatorEntity, SensorEntity):
         update_success = self.coordinator.last_update_success
         update_success_changed = update_success != self._last_update_success
         current_value = self._current_item_value()
-        self._sync_cached_numeric_values(current_value, update_energy=update_success_changed)
+        self._current_value = current_value
+        if self._tracks_numeric_state:
+            self._sync_cached_numeric_values(current_value, update_energy=update_success_changed)
         if update_success_changed:
             self._last_update_success = update_success
             super()._handle_coordinator_update()
@@ -352,7 +364,7 @@ class SOLARWATTItemSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self):
-        val = self._current_item_value()
+        val = self._current_value
         if self._is_total_increasing_energy and self._is_invalid_numeric_value(val):
             return self._last_energy_value
         if self._is_power and self._is_invalid_numeric_value(val):
@@ -526,28 +538,37 @@ class SOLARWATTThingSensor(CoordinatorEntity, SensorEntity):
         self._attr_name = get_thing_display_name(thing, thing_uid) or thing_uid
         self._attr_device_info = build_thing_device_info(
             self.coordinator.hass,
-            get_device_registry_anchor(self.coordinator.entry),
+            self.coordinator.device_anchor,
             thing,
             self.coordinator.things,
             selected_thing_uids,
-            str(self.coordinator.client.host or ""),
+            self.coordinator.configuration_host,
         )
+        self._cached_status: str | None = None
+        self._cached_attrs: dict = {}
+        self._sync_thing_state(thing)
 
     def _thing(self) -> dict | None:
         return self.coordinator.things.get(self._thing_uid)
 
+    def _sync_thing_state(self, thing: dict | None) -> None:
+        """Cache status and attributes so the state properties are plain reads."""
+        if not thing:
+            self._cached_status = None
+            self._cached_attrs = {}
+            return
+        self._cached_status = (thing.get("statusInfo") or {}).get("status") or None
+        props = thing.get("properties")
+        self._cached_attrs = props if isinstance(props, dict) else {}
+
+    def _handle_coordinator_update(self) -> None:
+        self._sync_thing_state(self._thing())
+        super()._handle_coordinator_update()
+
     @property
     def native_value(self):
-        thing = self._thing()
-        if not thing:
-            return None
-        status = (thing.get("statusInfo") or {}).get("status")
-        return status or None
+        return self._cached_status
 
     @property
     def extra_state_attributes(self):
-        thing = self._thing()
-        if not thing:
-            return {}
-        props = thing.get("properties")
-        return props if isinstance(props, dict) else {}
+        return self._cached_attrs
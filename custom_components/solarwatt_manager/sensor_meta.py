@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
@@ -57,6 +58,10 @@ _ITEM_TYPE_DOMAIN_MAP: tuple[tuple[str, str], ...] = (
     ("Number:Dimensionless", "percentage"),
 )
 
+# Exact-match lookup for the common case; the prefix scan below stays as
+# fallback for typed variants such as "Number:Power:...".
+_ITEM_TYPE_DOMAIN_EXACT: dict[str, str] = dict(_ITEM_TYPE_DOMAIN_MAP)
+
 _CHANNEL_TYPE_UID_HINTS: tuple[tuple[str, str], ...] = (
     ("power-factor", "Number:Dimensionless"),
     ("powerfactor", "Number:Dimensionless"),
@@ -146,10 +151,34 @@ def guess_ha_meta(
     item_name: str | None = None,
     channel_metadata: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Map OpenHAB/SOLARWATT state metadata to Home Assistant sensor metadata."""
+    """Map OpenHAB/SOLARWATT state metadata to Home Assistant sensor metadata.
+
+    The mapping is pure and depends only on a handful of rarely-changing
+    inputs, so the real work is memoized per (type, unit, name, metadata).
+    """
+    metadata_key = tuple(sorted(channel_metadata.items())) if channel_metadata else None
+    return dict(
+        _guess_ha_meta_cached(
+            oh_type,
+            parsed.unit if parsed else None,
+            item_name,
+            metadata_key,
+        )
+    )
+
+
+@lru_cache(maxsize=512)
+def _guess_ha_meta_cached(
+    oh_type: str | None,
+    unit: str | None,
+    item_name: str | None,
+    metadata_key: tuple[tuple[str, Any], ...] | None,
+) -> dict[str, Any]:
+    """Compute sensor metadata for one distinct item shape."""
+    channel_metadata = dict(metadata_key) if metadata_key else None
     channel_item_type = _typed_channel_item_type(channel_metadata)
     effective_oh_type = channel_item_type or oh_type
-    unit = (parsed.unit if parsed else None) or _unit_from_channel_metadata(channel_metadata)
+    unit = unit or _unit_from_channel_metadata(channel_metadata)
     name_l = (item_name or "").lower()
     compact_name = _compact_name(name_l)
     total_increasing_energy = _is_total_increasing_energy(name_l, channel_metadata)
@@ -255,6 +284,8 @@ def _item_type_from_channel_type_uid(channel_type_uid: str) -> str | None:
 
 def _domain_from_item_type(item_type: str) -> str | None:
     """Return the normalized sensor domain implied by an OpenHAB item type."""
+    if (domain := _ITEM_TYPE_DOMAIN_EXACT.get(item_type)) is not None:
+        return domain
     for prefix, domain in _ITEM_TYPE_DOMAIN_MAP:
         if item_type.startswith(prefix):
             return domain
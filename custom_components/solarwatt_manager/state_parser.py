@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import math
 import re
+import sys
 from typing import Any
 import unicodedata
 
@@ -28,6 +30,12 @@ _SCALED_UNITS = {
     "uWh": (1_000_000.0, "Wh"),
     "uHz": (1_000_000.0, "Hz"),
 }
+# Units recur across every parsed item; interning lets repeated parses share
+# one string object and win unit comparisons on identity.
+_INTERNED_UNITS = {
+    unit: sys.intern(unit)
+    for unit in ("W", "kW", "Wh", "kWh", "Ws", "V", "A", "Ah", "Hz", "°C", "C", "%", "Ω", "s")
+}
 _ROUND_DIGITS_BY_UNIT = {
     "kWh": 3,
     "kW": 3,
@@ -40,14 +48,14 @@ _ROUND_DIGITS_BY_UNIT = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedState:
     value: Any
     unit: str | None = None
     timestamp_ms: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SOLARWATTItem:
     name: str
     raw: dict[str, Any]
@@ -56,6 +64,11 @@ class SOLARWATTItem:
     editable: bool
     label: str | None = None
     category: str | None = None
+    # Classified once at construction so discovery loops read a plain flag.
+    is_switch: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.is_switch = self.oh_type is not None and self.oh_type.startswith("Switch")
 
 
 def _extract_unit_from_pattern(pattern: str | None) -> str | None:
@@ -78,6 +91,7 @@ def _normalize_unit(unit: str | None) -> str | None:
     unit = unit.replace("µ", "u").replace("μ", "u")
     unit = unit.replace("\\u00b0", "°")
     unit = _UNIT_ALIASES.get(unit, unit)
+    unit = _INTERNED_UNITS.get(unit, unit)
     return unit or None
 
 
@@ -116,7 +130,10 @@ def parse_state(
     if state is None:
         return ParsedState(value=None)
 
-    s = unicodedata.normalize("NFKC", str(state).strip())
+    s = str(state).strip()
+    if not s.isascii():
+        # NFKC is the identity on ASCII, which covers almost every state.
+        s = unicodedata.normalize("NFKC", s)
 
     if s in _UNAVAILABLE_STATES:
         return ParsedState(value=None)
@@ -127,10 +144,10 @@ def parse_state(
         return ParsedState(value=(s == "ON"))
 
     # timestamp|value unit
-    if "|" in s:
-        left, right = s.split("|", 1)
-        left = left.strip()
-        right = right.strip()
+    pipe = s.find("|")
+    if pipe != -1:
+        left = s[:pipe].strip()
+        right = s[pipe + 1 :].strip()
         ts = None
         if left.isdigit():
             try:
@@ -141,6 +158,19 @@ def parse_state(
         ps.timestamp_ms = ts
         return ps
 
+    # Bare numeric states are common; handle them without the regex. A
+    # pattern can still supply a unit (and with it Wh→kWh scaling), so the
+    # fast path only applies without one. "NaN"/"inf" and underscore
+    # separators fall through so they keep parsing as plain strings.
+    if pattern is None and s and s[0] in "+-.0123456789" and "_" not in s:
+        try:
+            val = float(s)
+        except ValueError:
+            pass
+        else:
+            if math.isfinite(val):
+                return ParsedState(value=int(val) if val.is_integer() else val)
+
     # numeric + optional unit
     m = _NUM_RE.match(s)
     if m:
@@ -13,7 +13,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import (
     SOLARWATTConfigEntry,
     build_thing_device_info,
-    get_device_registry_anchor,
     get_selected_thing_uids,
     get_thing_display_name,
 )
@@ -122,11 +121,11 @@ class SOLARWATTHEMSOptimizationSwitch(CoordinatorEntity, SwitchEntity):
         )
         self._attr_device_info = build_thing_device_info(
             self.coordinator.hass,
-            get_device_registry_anchor(self.coordinator.entry),
+            self.coordinator.device_anchor,
             thing,
             self.coordinator.things,
             selected_thing_uids,
-            str(self.coordinator.client.host or ""),
+            self.coordinator.configuration_host,
         )
 
     @property
@@ -57,6 +57,7 @@ def _load_coordinator_module():
         "DEFAULT_SCAN_INTERVAL": 15,
         "MAX_SCAN_INTERVAL": 3600,
         "MIN_SCAN_INTERVAL": 10,
+        "get_device_registry_anchor": lambda entry: "test-anchor",
     }
 
     module = load_component_module_with_stubs(
@@ -122,6 +123,7 @@ coordinator_module, SolarwattError, SolarwattAuthError, ConfigEntryAuthFailed =
 
 class FakeEntry:
     def __init__(self, *, hems_enabled: bool):
+        self.data = {}
         self.options = {
             "scan_interval": 15,
             "kiwigrid_hems_enabled": hems_enabled,
@@ -225,6 +227,46 @@ def test_single_source_auth_failure_raises_config_entry_auth_failed():
     assert entry.reauth_calls == 0
 
 
+def test_apply_entry_update_handles_noop_and_scan_interval_changes():
+    coordinator, entry, _ = _coordinator()
+
+    assert coordinator.apply_entry_update() is True
+
+    entry.options = {**entry.options, "scan_interval": 30}
+    assert coordinator.apply_entry_update() is True
+    assert coordinator.update_interval.total_seconds() == 30
+
+    entry.options = {**entry.options, "kiwigrid_hems_enabled": False}
+    assert coordinator.apply_entry_update() is False
+
+
+def test_apply_entry_update_requires_reload_for_data_changes():
+    coordinator, entry, _ = _coordinator()
+    entry.data = {"host": "other.local"}
+
+    assert coordinator.apply_entry_update() is False
+
+
+def test_unchanged_states_reuse_previous_parse_result(monkeypatch):
+    coordinator, _, client = _coordinator(hems_enabled=False)
+    parse_calls: list[Any] = []
+
+    def _counting_parse_state(state, pattern, item_type):
+        parse_calls.append(state)
+        return state
+
+    monkeypatch.setattr(coordinator_module, "parse_state", _counting_parse_state)
+
+    first_result = asyncio.run(coordinator._async_update_data())
+    second_result = asyncio.run(coordinator._async_update_data())
+    client.local_result = [_item("local_power", "200 W")]
+    third_result = asyncio.run(coordinator._async_update_data())
+
+    assert parse_calls == ["100 W", "200 W"]
+    assert second_result["local_power"].parsed is first_result["local_power"].parsed
+    assert third_result["local_power"].parsed == "200 W"
+
+
 def test_hems_failures_are_retried_only_after_backoff(caplog):
     coordinator, _, client = _coordinator(local_enabled=False)
     client.hems_result = SolarwattError("stats unavailable")
@@ -37,6 +37,26 @@ def test_parse_numeric_states_with_normalized_units(
     assert parsed.unit == expected_unit
 
 
+@pytest.mark.parametrize(
+    ("raw_state", "expected_value"),
+    [
+        ("0", 0),
+        ("42", 42),
+        ("-17", -17),
+        ("3.5", 3.5),
+    ],
+)
+def test_parse_bare_numeric_states(raw_state, expected_value):
+    parsed = parse_state(raw_state)
+
+    assert parsed.value == expected_value
+    assert parsed.unit is None
+
+
+def test_parse_nan_state_stays_text():
+    assert parse_state("NaN").value == "NaN"
+
+
 def test_parse_timestamped_state():
     parsed = parse_state("1714131600000|1234 W")
 